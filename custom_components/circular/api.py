@@ -1,14 +1,16 @@
 """API Client."""
 
 import asyncio
-import time
+import contextlib
+import logging
 from asyncio import Task
+from collections.abc import Callable
 from enum import Enum
+from typing import Any, NamedTuple
 
 import aiohttp
 from aiohttp import ClientOSError
 
-from custom_components.circular.winet.exceptions import ApiRegisterError
 from custom_components.circular.winet.const import (
     WinetProductModel,
     WinetRegister,
@@ -19,6 +21,7 @@ from custom_components.circular.winet.model import WinetGetRegisterResult
 from custom_components.circular.winet.winet import WinetAPILocal
 
 from .const import (
+    DEFAULT_DELTA_ECOMODE_TEMP,
     DOMAIN,
     LOGGER,
     MAX_FAN_SPEED,
@@ -29,12 +32,31 @@ from .const import (
     MIN_THERMOSTAT_TEMP,
     MIN_DELTA_ECOMODE_TEMP,
     MAX_DELTA_ECOMODE_TEMP,
+    MAX_POLL_BACKOFF,
 )
 
 
-def clamp(value, valuemin, valuemax) -> float | int:
-    """Clamp value between min and max."""
-    return valuemin if value < valuemin else valuemax if value > valuemax else value
+# Register ids read on every poll
+_REG_STATUS = WinetRegister.STATUS.value
+_REG_ALARMS_BITS = WinetRegister.ALARMS_BITS.value
+_REG_TEMPERATURE_PROBE = WinetRegister.TEMPERATURE_PROBE.value
+_REG_TEMPERATURE_SET = WinetRegister.TEMPERATURE_SET.value
+_REG_POWER_SET = WinetRegister.POWER_SET.value
+_REG_FAN_AR_SPEED = WinetRegister.FAN_AR_SPEED.value
+
+_POLL_CATEGORIES = (
+    WinetRegisterCategory.POLL_CATEGORY_2,  # Alarm, Temp, Power
+    WinetRegisterCategory.POLL_CATEGORY_4,  # Configuration : Fan
+    WinetRegisterCategory.POLL_CATEGORY_6,  # Alarm
+)
+# Categories whose results carry the alarm byte (ALARMS_BITS)
+_ALARM_CATEGORIES = frozenset(
+    {WinetRegisterCategory.POLL_CATEGORY_2, WinetRegisterCategory.POLL_CATEGORY_6}
+)
+# Status and alarm byte, enough while the stove stays off
+_IDLE_POLL_CATEGORIES = (WinetRegisterCategory.POLL_CATEGORY_2,)
+_IDLE_POLLS_BEFORE_REDUCING = 3
+_IDLE_FULL_POLL_EVERY = 10
 
 
 class CircularDeviceStatus(Enum):  # type: ignore
@@ -56,31 +78,27 @@ class CircularDeviceStatus(Enum):  # type: ignore
 
     def get_message(self) -> str:
         """Get a message associated with the enum."""
-        if self.name == "OFF":
-            return "Off"
-        if self.name == "WAIT_FOR_FLAME":
-            return "Waiting flame"
-        if self.name == "POWER_ON":
-            return "Power on"
-        if self.name == "UNKNOWN_1":
-            return "Unknown"
-        if self.name == "STABLE_FLAME":
-            return "Stable Flame"
-        if self.name == "WORK":
-            return "Working"
-        if self.name == "BRAZIER_CLEANING":
-            return "Brazzier cleaning"
-        if self.name == "FINAL_CLEANING":
-            return "Final cleaning"
-        if self.name == "ECO_STOP":
-            return "Eco_Stop"
-        if self.name == "ALARM":
-            return "Alarm"
-        if self.name == "MODULA":
-            return "Modula"
-        if self.name == "UNKNOWN":
-            return "Unknown"
-        return f"Unknown status{self.name}"
+        return _STATUS_MESSAGES.get(self, f"Unknown status{self.name}")
+
+
+_STATUS_MESSAGES: dict[CircularDeviceStatus, str] = {
+    CircularDeviceStatus.OFF: "Off",
+    CircularDeviceStatus.WAIT_FOR_FLAME: "Waiting flame",
+    CircularDeviceStatus.POWER_ON: "Power on",
+    CircularDeviceStatus.UNKNOWN_1: "Unknown",
+    CircularDeviceStatus.STABLE_FLAME: "Stable Flame",
+    CircularDeviceStatus.WORK: "Working",
+    CircularDeviceStatus.BRAZIER_CLEANING: "Brazzier cleaning",
+    CircularDeviceStatus.FINAL_CLEANING: "Final cleaning",
+    CircularDeviceStatus.ECO_STOP: "Eco_Stop",
+    CircularDeviceStatus.ALARM: "Alarm",
+    CircularDeviceStatus.MODULA: "Modula",
+    CircularDeviceStatus.UNKNOWN: "Unknown",
+}
+
+_STATUS_BY_VALUE: dict[int, CircularDeviceStatus] = {
+    status.value: status for status in CircularDeviceStatus
+}
 
 
 class CircularDeviceAlarm(Enum):  # type: ignore
@@ -105,210 +123,281 @@ class CircularDeviceAlarm(Enum):  # type: ignore
 
     def get_message(self) -> str:
         """Get a message associated with the enum."""
-        if self.name == "SMOKE_PROBE_FAILURE":
-            return "Smoke probe failure !"
-        if self.name == "SMOKE_OVERTEMPERATURE":
-            return "Smoke over-temperature !"
-        if self.name == "EXTRACTOR_MALFUNCTION":
-            return "Extractor malfunction !"
-        if self.name == "FAILED_IGNITION":
-            return "Failed ignition"
-        if self.name == "NO_PELLETS":
-            return "No pellets"
-        if self.name == "LACK_OF_PRESSURE":
-            return "Lacks of pressure !"
-        if self.name == "THERMAL_SAFETY":
-            return "Thermal safety !"
-        if self.name == "OPEN_PELLET_COMPARTMENT":
-            return "Pellet compartment is open !"
-        return "UNKNOWN"
+        return _ALARM_MESSAGES.get(self, "UNKNOWN")
+
+
+_ALARM_MESSAGES: dict[CircularDeviceAlarm, str] = {
+    CircularDeviceAlarm.SMOKE_PROBE_FAILURE: "Smoke probe failure !",
+    CircularDeviceAlarm.SMOKE_OVERTEMPERATURE: "Smoke over-temperature !",
+    CircularDeviceAlarm.EXTRACTOR_MALFUNCTION: "Extractor malfunction !",
+    CircularDeviceAlarm.FAILED_IGNITION: "Failed ignition",
+    CircularDeviceAlarm.NO_PELLETS: "No pellets",
+    CircularDeviceAlarm.LACK_OF_PRESSURE: "Lacks of pressure !",
+    CircularDeviceAlarm.THERMAL_SAFETY: "Thermal safety !",
+    CircularDeviceAlarm.OPEN_PELLET_COMPARTMENT: "Pellet compartment is open !",
+}
+
+_ALARM_BY_VALUE: dict[int, CircularDeviceAlarm] = {
+    alarm.value: alarm for alarm in CircularDeviceAlarm
+}
+
+# Alarm bits tested against CircularApiData._alarm_mask
+_MASK_EXTRACTOR_MALFUNCTION = 1 << CircularDeviceAlarm.EXTRACTOR_MALFUNCTION.value
+_MASK_FAILED_IGNITION = 1 << CircularDeviceAlarm.FAILED_IGNITION.value
+_MASK_LACK_OF_PRESSURE = 1 << CircularDeviceAlarm.LACK_OF_PRESSURE.value
+_MASK_NO_PELLETS = 1 << CircularDeviceAlarm.NO_PELLETS.value
+_MASK_OPEN_PELLET_COMPARTMENT = 1 << CircularDeviceAlarm.OPEN_PELLET_COMPARTMENT.value
+_MASK_SMOKE_OVERTEMPERATURE = 1 << CircularDeviceAlarm.SMOKE_OVERTEMPERATURE.value
+_MASK_SMOKE_PROBE_FAILURE = 1 << CircularDeviceAlarm.SMOKE_PROBE_FAILURE.value
+_MASK_THERMAL_SAFETY = 1 << CircularDeviceAlarm.THERMAL_SAFETY.value
+
+_MODEL_BY_VALUE: dict[int, WinetProductModel] = {
+    model.value: model for model in WinetProductModel
+}
+
+
+def _status_from_value(value: int) -> CircularDeviceStatus:
+    """Map a raw status register value to its status."""
+    return _STATUS_BY_VALUE.get(value, CircularDeviceStatus.UNKNOWN)
+
+
+# Registers decoded into CircularApiData attributes, per poll category
+_CATEGORY_REGISTERS: dict[
+    WinetRegisterCategory,
+    tuple[tuple[int, str, Callable[[int], Any] | None], ...],
+] = {
+    WinetRegisterCategory.POLL_CATEGORY_2: (
+        (_REG_TEMPERATURE_PROBE, "temperature_read", None),
+        (_REG_TEMPERATURE_SET, "temperature_set", None),
+        (_REG_POWER_SET, "power_set", None),
+        (_REG_STATUS, "status", _status_from_value),
+    ),
+    WinetRegisterCategory.POLL_CATEGORY_6: ((_REG_FAN_AR_SPEED, "fan_speed", None),),
+}
+
+# Poll category reporting each register the client writes
+_REGISTER_CATEGORIES: dict[WinetRegister, WinetRegisterCategory] = {
+    WinetRegister.TEMPERATURE_SET: WinetRegisterCategory.POLL_CATEGORY_2,
+    WinetRegister.POWER_SET: WinetRegisterCategory.POLL_CATEGORY_2,
+    WinetRegister.FAN_AR_SPEED: WinetRegisterCategory.POLL_CATEGORY_6,
+}
+
+
+class CircularApiSnapshot(NamedTuple):
+    """Immutable view of the decoded values, compared between polls."""
+
+    status: CircularDeviceStatus
+    alarm_mask: int
+    temperature_read: float
+    temperature_set: float
+    power_set: int
+    fan_speed: int
+    signal: int
+    alr: str
+    name: str
+    model: WinetProductModel
+    host: str
+    # derived from status and alarm_mask, carried for the entities
+    is_on: bool
+    is_heating: bool
+    is_ecomode_stop: bool
+    error_offline: bool
+    alarm_extractor_malfunction: bool
+    alarm_failed_ignition: bool
+    alarm_lack_of_pressure: bool
+    alarm_no_pellets: bool
+    alarm_open_pellet_compartment: bool
+    alarm_smoke_overtemp: bool
+    alarm_smoke_probe_failure: bool
+    alarm_thermal_safety: bool
 
 
 class CircularApiData:
     """Usable api data for the home assistant integration."""
 
+    __slots__ = (
+        "_alarm_mask",
+        "_last_results",
+        "_params",
+        "alarm_extractor_malfunction",
+        "alarm_failed_ignition",
+        "alarm_lack_of_pressure",
+        "alarm_no_pellets",
+        "alarm_open_pellet_compartment",
+        "alarm_smoke_overtemp",
+        "alarm_smoke_probe_failure",
+        "alarm_thermal_safety",
+        "alarms",
+        "alr",
+        "error_offline",
+        "fan_speed",
+        "host",
+        "is_ecomode_stop",
+        "is_heating",
+        "is_on",
+        "model",
+        "name",
+        "power_set",
+        "signal",
+        "status",
+        "temperature_read",
+        "temperature_set",
+    )
+
     def __init__(self, host: str):
         """Init unset data."""
-        self._rawdata = WinetGetRegisterResult()
-        self.signal = self._rawdata.signal
-        self.name = self._rawdata.name
-        self.alr = self._rawdata.alr
+        defaults = WinetGetRegisterResult()
+        self._params: dict[int, int] = {}
+        self._last_results: dict[WinetRegisterCategory, WinetGetRegisterResult] = {}
+        self.signal = defaults.signal
+        self.name = defaults.name
+        self.alr = defaults.alr
         self.host = host
-        self.model = WinetProductModel(self._rawdata.model).get_message()
+        self.model = WinetProductModel.UNSET
         self.status = CircularDeviceStatus.UNKNOWN
-        self.alarms = []
+        self.alarms: frozenset[CircularDeviceAlarm] = frozenset()
+        self._alarm_mask = 0
         self.temperature_read = 0.0
         self.temperature_set = 0.0
         self.power_set = 0
         self.fan_speed = 0
-        self._delta_ecomode = 0.0
-        self._delta_ecomode_ask = False
+        self._refresh_flags()
 
     def update(
         self,
         newdata: WinetGetRegisterResult,
         category: WinetRegisterCategory = WinetRegisterCategory.NONE,
     ) -> None:
-        """Update or add data to rawdata."""
-        # convert actual data to dict
-        newparamsdict = {}
-        for oldparam in self._rawdata.params:
-            key = oldparam[0]
-            value = oldparam[1]
-            newparamsdict[key] = value
-
-        # overwrite or add new key/values
-        for newparam in newdata.params:
-            key = newparam[0]
-            value = newparam[1]
-            newparamsdict[key] = value
-
-        # convert back to list of int,int
-        newparams = []
-        for key, val in newparamsdict.items():
-            newparams.append([key, val])
-
-        # update class data
-        self._rawdata.params = newparams
-        self._rawdata.cat = newdata.cat
-        self._rawdata.signal = newdata.signal
-        self._rawdata.alr = newdata.alr
-        self._rawdata.authlevel = newdata.authlevel
-        self._rawdata.model = newdata.model
-        self._rawdata.name = newdata.name
-
-        if category == WinetRegisterCategory.POLL_CATEGORY_2:
-            self._decode_temperature_read()
-            self._decode_temperature_set()
-            self._decode_power_set()
-            self._decode_status()
-
-        if category == WinetRegisterCategory.POLL_CATEGORY_6:
+        """Merge new register data and decode the polled category."""
+        # nothing to merge or decode if the module returned the same payload
+        if self._last_results.get(category) == newdata:
+            return
+        self._last_results[category] = newdata
+
+        # overwrite or add new key/values from the [id, value] pairs
+        self._params.update(newdata.params)
+
+        self._decode_registers(category)
+
+        if category in _ALARM_CATEGORIES:
             self._decode_alarms()
-            self._decode_fan_speed()
+
+        self._refresh_flags()
 
         if category != WinetRegisterCategory.NONE:
             self.signal = newdata.signal
             self.alr = newdata.alr
             self.name = newdata.name
-            self.model = WinetProductModel(newdata.model)
-
-    def _get_register_value(self, registerid: WinetRegister) -> int:
-        """Parse all data (memory banks?) to find a register's value."""
-        for param in self._rawdata.params:
-            if param[0] == registerid.value:
-                return param[1]
-        LOGGER.error(f"RegisterId {registerid.value} not found in data")
-        LOGGER.debug(self._rawdata)
-        msg = "RegisterId not found in data"
-        raise ApiRegisterError(msg)
-
-    def _decode_status(self) -> None:
-        """Decode status register."""
-        status = self._get_register_value(WinetRegister.STATUS)
-        self.status = CircularDeviceStatus(status)
+            if newdata.model != self.model.value:
+                self.model = _MODEL_BY_VALUE.get(newdata.model, WinetProductModel.UNSET)
+
+    def forget_category(self, category: WinetRegisterCategory) -> None:
+        """Decode the category's next result even if it did not change."""
+        self._last_results.pop(category, None)
+
+    def _get_register_value(self, registerid: int) -> int | None:
+        """Look up a register's value in the merged data (memory banks?)."""
+        value = self._params.get(registerid)
+        if value is None:
+            LOGGER.error("RegisterId %d not found in data", registerid)
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("Known registers: %s", sorted(self._params))
+        return value
 
     def _decode_alarms(self) -> None:
         """Decode alarm register byte into individual alarms."""
-        alarmsbyte = self._get_register_value(WinetRegister.ALARMS_BITS)
-        LOGGER.debug(f"Alarm byte value is {alarmsbyte}")
+        alarmsbyte = self._get_register_value(_REG_ALARMS_BITS)
+        if alarmsbyte is None:
+            return
+        LOGGER.debug("Alarm byte value is %d", alarmsbyte)
         if alarmsbyte < 0:
             LOGGER.error("Cannot decode alarms")
             return
-        self.alarms.clear()
-        self.alarms.append(CircularDeviceAlarm(alarmsbyte))
-
-    def _decode_temperature_read(self) -> None:
-        """Update Temperature read register."""
-        param = self._get_register_value(WinetRegister.TEMPERATURE_PROBE)
-        self.temperature_read = param
-
-    def _decode_temperature_set(self) -> None:
-        """Update Temperature set register."""
-        param = self._get_register_value(WinetRegister.TEMPERATURE_SET)
-        self.temperature_set = param
-
-    def _decode_power_set(self) -> None:
-        """Power set."""
-        self.power_set = self._get_register_value(WinetRegister.POWER_SET)
-
-    def _decode_fan_speed(self) -> None:
-        """Room vent fan speed."""
-        self.fan_speed = self._get_register_value(WinetRegister.FAN_AR_SPEED)
+        alarm = _ALARM_BY_VALUE.get(alarmsbyte)
+        if alarm is None:
+            LOGGER.warning("Unknown alarm byte value %d", alarmsbyte)
+            self.alarms = frozenset()
+        else:
+            self.alarms = frozenset((alarm,))
+        self._alarm_mask = 1 << alarmsbyte
+
+    def _decode_registers(self, category: WinetRegisterCategory) -> None:
+        """Decode the category's registers into their attributes."""
+        for registerid, attribute, transform in _CATEGORY_REGISTERS.get(category, ()):
+            value = self._get_register_value(registerid)
+            if value is not None:
+                setattr(self, attribute, transform(value) if transform else value)
 
     @property
-    def is_on(self) -> bool:
-        """Is stove on ?."""
-        return self.status not in [
-            CircularDeviceStatus.OFF,
-        ]
-
-    @property
-    def is_heating(self) -> bool:
-        """Is heating ?."""
-        return self.status in [CircularDeviceStatus.WORK]
-
-    @property
-    def is_ecomode_stop(self) -> bool:
-        """Is heating ?."""
-        return self.status in [CircularDeviceStatus.ECO_STOP]
-
-    @property
-    def error_offline(self) -> bool:
-        """Is offline ?."""
-        return self.status in [
-            CircularDeviceStatus.ALARM,
-        ]
-        return self.status == CircularDeviceStatus.UNKNOWN
-
-    @property
-    def alarm_extractor_malfunction(self) -> bool:
-        """Alarm bit for extractor malfunction is set ?."""
-        return CircularDeviceAlarm.EXTRACTOR_MALFUNCTION in self.alarms
-
-    @property
-    def alarm_failed_ignition(self) -> bool:
-        """Alarm bit for failed ignition is set ?."""
-        return CircularDeviceAlarm.FAILED_IGNITION in self.alarms
-
-    @property
-    def alarm_lack_of_pressure(self) -> bool:
-        """.alarm bit for lack of pressure is set ?."""
-        return CircularDeviceAlarm.LACK_OF_PRESSURE in self.alarms
-
-    @property
-    def alarm_no_pellets(self) -> bool:
-        """Alarm bit for no pellets is set ?."""
-        return CircularDeviceAlarm.NO_PELLETS in self.alarms
-
-    @property
-    def alarm_open_pellet_compartment(self) -> bool:
-        """Alarm bit for open pellet compartment is set ?."""
-        return CircularDeviceAlarm.OPEN_PELLET_COMPARTMENT in self.alarms
-
-    @property
-    def alarm_smoke_overtemp(self) -> bool:
-        """Alarm bit for smoke temperature is set ?."""
-        return CircularDeviceAlarm.SMOKE_OVERTEMPERATURE in self.alarms
-
-    @property
-    def alarm_smoke_probe_failure(self) -> bool:
-        """Alarm bit for smoke probe failure is set?."""
-        return CircularDeviceAlarm.SMOKE_PROBE_FAILURE in self.alarms
+    def snapshot(self) -> CircularApiSnapshot:
+        """Return an immutable copy of the decoded values."""
+        return CircularApiSnapshot(
+            status=self.status,
+            alarm_mask=self._alarm_mask,
+            temperature_read=self.temperature_read,
+            temperature_set=self.temperature_set,
+            power_set=self.power_set,
+            fan_speed=self.fan_speed,
+            signal=self.signal,
+            alr=self.alr,
+            name=self.name,
+            model=self.model,
+            host=self.host,
+            is_on=self.is_on,
+            is_heating=self.is_heating,
+            is_ecomode_stop=self.is_ecomode_stop,
+            error_offline=self.error_offline,
+            alarm_extractor_malfunction=self.alarm_extractor_malfunction,
+            alarm_failed_ignition=self.alarm_failed_ignition,
+            alarm_lack_of_pressure=self.alarm_lack_of_pressure,
+            alarm_no_pellets=self.alarm_no_pellets,
+            alarm_open_pellet_compartment=self.alarm_open_pellet_compartment,
+            alarm_smoke_overtemp=self.alarm_smoke_overtemp,
+            alarm_smoke_probe_failure=self.alarm_smoke_probe_failure,
+            alarm_thermal_safety=self.alarm_thermal_safety,
+        )
 
-    @property
-    def alarm_thermal_safety(self) -> bool:
-        """Alarm bit for thermal safety is set?."""
-        return CircularDeviceAlarm.THERMAL_SAFETY in self.alarms
+    def _refresh_flags(self) -> None:
+        """Derive the status and alarm flags read by the entities."""
+        status = self.status
+        mask = self._alarm_mask
+        self.is_on = status is not CircularDeviceStatus.OFF
+        self.is_heating = status is CircularDeviceStatus.WORK
+        self.is_ecomode_stop = status is CircularDeviceStatus.ECO_STOP
+        self.error_offline = (
+            status is CircularDeviceStatus.ALARM
+            or status is CircularDeviceStatus.UNKNOWN
+        )
+        self.alarm_extractor_malfunction = bool(mask & _MASK_EXTRACTOR_MALFUNCTION)
+        self.alarm_failed_ignition = bool(mask & _MASK_FAILED_IGNITION)
+        self.alarm_lack_of_pressure = bool(mask & _MASK_LACK_OF_PRESSURE)
+        self.alarm_no_pellets = bool(mask & _MASK_NO_PELLETS)
+        self.alarm_open_pellet_compartment = bool(mask & _MASK_OPEN_PELLET_COMPARTMENT)
+        self.alarm_smoke_overtemp = bool(mask & _MASK_SMOKE_OVERTEMPERATURE)
+        self.alarm_smoke_probe_failure = bool(mask & _MASK_SMOKE_PROBE_FAILURE)
+        self.alarm_thermal_safety = bool(mask & _MASK_THERMAL_SAFETY)
 
 
 class CircularApiClient:
     """Circular api client. use winet control api polling as backend."""
 
-    failed_poll_attempts = 0
-    is_sending = False
-    is_polling_in_background = False
-    stove_ip = ""
+    __slots__ = (
+        "_bg_task",
+        "_data",
+        "_delta_ecomode",
+        "_host",
+        "_off_streak",
+        "_on_poll",
+        "_poll_lock",
+        "_session",
+        "_should_poll_in_background",
+        "_winetclient",
+        "delta_ecomode_ask",
+        "failed_poll_attempts",
+        "is_polling_in_background",
+        "is_sending",
+        "stove_ip",
+    )
 
     def __init__(self, session: aiohttp.ClientSession, host: str) -> None:
         """Init."""
@@ -318,12 +407,16 @@ class CircularApiClient:
         self._winetclient = WinetAPILocal(session, host)
         self._should_poll_in_background = False
         self._bg_task: Task | None = None
+        self._poll_lock = asyncio.Lock()
+        self._off_streak = 0
+        self._on_poll: Callable[[], None] | None = None
 
         self.stove_ip = host
         self.is_polling_in_background = False
         self.is_sending = False
         self.failed_poll_attempts = 0
         self.delta_ecomode_ask = False
+        self._delta_ecomode = DEFAULT_DELTA_ECOMODE_TEMP
 
     @property
     def data(self) -> CircularApiData:
@@ -342,6 +435,10 @@ class CircularApiClient:
             self._should_poll_in_background,
         )
 
+    def set_poll_listener(self, listener: Callable[[], None] | None) -> None:
+        """Register a callback run after each successful background poll."""
+        self._on_poll = listener
+
     async def start_background_polling(self, minimum_wait_in_seconds: int = 5) -> None:
         """Start an ensure-future background polling loop."""
         if self.is_sending:
@@ -350,7 +447,9 @@ class CircularApiClient:
             )
             return
 
-        if not self._should_poll_in_background:
+        # a loop that died leaves _should_poll_in_background set, only the
+        # task itself tells whether polling is still running
+        if self._bg_task is None or self._bg_task.done():
             self._should_poll_in_background = True
             LOGGER.info("!!  start_background_polling !!")
 
@@ -359,16 +458,22 @@ class CircularApiClient:
                 name="background_polling",
             )
 
-    def stop_background_polling(self) -> bool:
+    async def stop_background_polling(self) -> bool:
         """Stop background polling - return whether it had been polling."""
         self._should_poll_in_background = False
-        was_running = False
-        if self._bg_task and not self._bg_task.cancelled():
-            was_running = True
-            self._bg_task.cancel()
-            LOGGER.info("Stopping background task to issue a command")
+        if self._bg_task is None or self._bg_task.done():
+            return False
 
-        return was_running
+        LOGGER.info("Stopping background task to issue a command")
+        self._bg_task.cancel()
+        # wait for the loop to unwind so a restart cannot overlap with it
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._bg_task
+        return True
+
+    async def close(self) -> None:
+        """Stop background polling; the shared session is owned by Home Assistant."""
+        await self.stop_background_polling()
 
     async def __background_poll(self, minimum_wait_in_seconds: int = 5) -> None:
         """Perform a polling loop."""
@@ -377,136 +482,176 @@ class CircularApiClient:
         self.failed_poll_attempts = 0
 
         self.is_polling_in_background = True
-        while self._should_poll_in_background:
-            start = time.time()
-            LOGGER.debug("__background_poll:: Loop start time %f", start)
-
-            try:
-                await self.poll()
-                self.failed_poll_attempts = 0
-                end = time.time()
-
-                duration: float = end - start
-                sleep_time: float = minimum_wait_in_seconds - duration
-
-                LOGGER.debug(
-                    "__background_poll:: [%f] Sleeping for [%fs]", duration, sleep_time
-                )
+        loop = asyncio.get_running_loop()
+        # the caller has just polled, wait one interval before the first poll
+        deadline = loop.time() + minimum_wait_in_seconds
+        try:
+            while self._should_poll_in_background:
+                # sleep until a fixed deadline so the cadence does not drift,
+                # resync on the current time if a poll overran its slot
+                now = loop.time()
+                deadline = max(deadline, now)
+                LOGGER.debug("__background_poll:: Sleeping for [%.2fs]", deadline - now)
+                await asyncio.sleep(deadline - now)
+
+                start = loop.time()
+                LOGGER.debug("__background_poll:: Loop start time %f", start)
+
+                try:
+                    await self.poll()
+                except (ConnectionError, ClientOSError):
+                    LOGGER.info(
+                        "__background_poll:: Polling error [x%d]",
+                        self.failed_poll_attempts + 1,
+                    )
+                except Exception:  # noqa: BLE001
+                    # keep the loop alive, the failure count surfaces it
+                    LOGGER.exception("__background_poll:: Unexpected polling error")
+                else:
+                    self.failed_poll_attempts = 0
+                    deadline += minimum_wait_in_seconds
+                    if self._on_poll is not None:
+                        self._on_poll()
+                    continue
 
-                LOGGER.debug(
-                    "__background_poll:: duration: %f, %f, %.2fs",
-                    start,
-                    end,
-                    (end - start),
-                )
-                LOGGER.debug(
-                    "__background_poll:: Should Sleep For: %f",
-                    (minimum_wait_in_seconds - (end - start)),
-                )
-
-                await asyncio.sleep(minimum_wait_in_seconds - (end - start))
-            except (ConnectionError, ClientOSError):
                 self.failed_poll_attempts += 1
-                LOGGER.info(
-                    "__background_poll:: Polling error [x%d]", self.failed_poll_attempts
+                # back off while the stove is unreachable instead of retrying
+                deadline = start + min(
+                    minimum_wait_in_seconds * 2 ** (self.failed_poll_attempts - 1),
+                    MAX_POLL_BACKOFF,
                 )
-
-        self.is_polling_in_background = False
-        LOGGER.info("__background_poll:: Background polling disabled.")
+        finally:
+            self.is_polling_in_background = False
+            LOGGER.info("__background_poll:: Background polling disabled.")
+
+    async def _set_register(self, register: WinetRegister, value: int) -> bool:
+        """Write a register, return whether the module accepted it."""
+        if not await self._winetclient.set_register(register, value):
+            return False
+        # the stove may still ignore an accepted value, make the next poll
+        # decode the register again even if the module repeats its payload
+        category = _REGISTER_CATEGORIES[register]
+        self._data.forget_category(category)
+        self._winetclient.forget_result(WinetRegisterKey.POLL_DATA, category)
+        return True
 
     async def set_fan_speed(self, value: float) -> None:
         """Set air room vent fan speed."""
         # ui min value is 0 (OFF) to 5 (HIGH) , 6 = (AUTO)
-        value = clamp(int(value), MIN_FAN_SPEED, MAX_FAN_SPEED)
-        LOGGER.debug(f"Set fan speed to {value}")
-        await self._winetclient.set_register(WinetRegister.FAN_AR_SPEED, int(value))
+        speed = min(max(int(value), MIN_FAN_SPEED), MAX_FAN_SPEED)
+        if speed == self._data.fan_speed:
+            LOGGER.debug("Fan speed already set to %s", speed)
+            return
+        LOGGER.debug("Set fan speed to %s", speed)
+        if await self._set_register(WinetRegister.FAN_AR_SPEED, speed):
+            # keep the check above accurate until the next poll confirms it
+            self._data.fan_speed = speed
 
     async def set_power(self, value: float) -> None:
         """Send set register with key=002&memory=1&regId=51&value={value} ."""
         # ui's min value is 1 and maximum is 5
-        value = clamp(int(value), MIN_POWER, MAX_POWER)
-        LOGGER.debug(f"Set power to {value}")
-        await self._winetclient.set_register(WinetRegister.POWER_SET, int(value))
+        power = min(max(int(value), MIN_POWER), MAX_POWER)
+        if power == self._data.power_set:
+            LOGGER.debug("Power already set to %s", power)
+            return
+        LOGGER.debug("Set power to %s", power)
+        if await self._set_register(WinetRegister.POWER_SET, power):
+            # keep the check above accurate until the next poll confirms it
+            self._data.power_set = power
 
     async def set_delta_temp(self, value: float) -> None:
         """Set Add temp for wake up stove with eco climat mode ."""
         # ui's min value is 1 and maximum is 5
-        value = clamp(int(value), MIN_DELTA_ECOMODE_TEMP, MAX_DELTA_ECOMODE_TEMP)
-        LOGGER.debug(f"Set Delta Eco Mode to {value}")
-        self._delta_ecomode = value
+        delta = min(max(int(value), MIN_DELTA_ECOMODE_TEMP), MAX_DELTA_ECOMODE_TEMP)
+        LOGGER.debug("Set Delta Eco Mode to %s", delta)
+        self._delta_ecomode = delta
 
     async def set_temperature(self, value: float) -> None:
         """Send set register with key=002&memory=1&regId=50&value={value} ."""
-        # self defined min/max values
-        value = clamp(
-            float(value), float(MIN_THERMOSTAT_TEMP), float(MAX_THERMOSTAT_TEMP)
+        # self defined min/max values, the stove only handles whole degrees
+        setpoint = round(
+            min(max(float(value), MIN_THERMOSTAT_TEMP), MAX_THERMOSTAT_TEMP)
         )
-        LOGGER.warning(f"Set temperature to {value}")
-        await self._winetclient.set_register(WinetRegister.TEMPERATURE_SET, int(value))
+        # skip writes that change nothing
+        if setpoint == self._data.temperature_set:
+            LOGGER.debug("Temperature already set to %s", setpoint)
+            return
+        LOGGER.debug("Set temperature to %s", setpoint)
+        if await self._set_register(WinetRegister.TEMPERATURE_SET, setpoint):
+            # keep the check above accurate until the next poll confirms it
+            self._data.temperature_set = setpoint
 
     async def set_temperature_with_delta(self, value: float) -> None:
         """Send set register with key=002&memory=1&regId=50&value={value} ."""
         # self defined min/max values
-        value = min(value + self._delta_ecomode, value)
         self.delta_ecomode_ask = True
-        value = clamp(
-            float(value), float(MIN_THERMOSTAT_TEMP), float(MAX_THERMOSTAT_TEMP)
+        setpoint = round(
+            min(
+                max(float(value) + self._delta_ecomode, MIN_THERMOSTAT_TEMP),
+                MAX_THERMOSTAT_TEMP,
+            )
         )
-        LOGGER.warning(f"Set temperature with delta to {value}")
-        await self._winetclient.set_register(WinetRegister.TEMPERATURE_SET, int(value))
+        LOGGER.debug("Set temperature with delta to %s", setpoint)
+        if await self._set_register(WinetRegister.TEMPERATURE_SET, setpoint):
+            self._data.temperature_set = setpoint
 
     async def set_temperature_without_delta(self, value: float) -> None:
         """Send set register with key=002&memory=1&regId=50&value={value} ."""
         # Stop ecomode with real target temperature
         if self.data.is_heating and self.delta_ecomode_ask:
-            value = max(value - self._delta_ecomode, value)
+            value = float(value) - self._delta_ecomode
             self.delta_ecomode_ask = False
             await self.set_temperature(value)
 
-    async def turn_on(self) -> None:
-        """Turn on the stove."""
-        if self.data.status != CircularDeviceStatus.OFF:
+    async def set_power_state(self, *, on: bool) -> None:
+        """Toggle the stove status unless it is already in the requested state."""
+        if self.data.is_on == on:
             return
-        LOGGER.debug("Turn stove on")
+        LOGGER.debug("Turn stove %s", "on" if on else "off")
         await self._winetclient.get_registers(WinetRegisterKey.CHANGE_STATUS)
 
-    async def turn_off(self) -> None:
+    async def turn_on(self) -> None:
         """Turn on the stove."""
-        if self.data.status == CircularDeviceStatus.OFF:
-            return
-        LOGGER.debug("Turn stove off")
-        await self._winetclient.get_registers(WinetRegisterKey.CHANGE_STATUS)
+        await self.set_power_state(on=True)
+
+    async def turn_off(self) -> None:
+        """Turn off the stove."""
+        await self.set_power_state(on=False)
 
     async def poll(self) -> None:
         """Poll the Winet module locally."""
-        # Update Alarm Temp,Power
-
-        result = await self._winetclient.get_registers(WinetRegisterKey.SUBSCRIBE)
-        if result is not None:
-            self._data.update(newdata=result, category=WinetRegisterCategory.NONE)
-
-        result = await self._winetclient.get_registers(
-            WinetRegisterKey.POLL_DATA, WinetRegisterCategory.POLL_CATEGORY_2
-        )
-        if result is not None:
-            self._data.update(
-                newdata=result, category=WinetRegisterCategory.POLL_CATEGORY_2
+        # the coordinator and the background loop may both poll, never overlap
+        async with self._poll_lock:
+            result = await self._winetclient.get_registers(WinetRegisterKey.SUBSCRIBE)
+            if result is not None:
+                self._data.update(newdata=result, category=WinetRegisterCategory.NONE)
+
+            # A stove that stays off only needs its status and alarms, both
+            # in category 2, with a full refresh now and then for the rest
+            categories = (
+                _IDLE_POLL_CATEGORIES
+                if self._off_streak >= _IDLE_POLLS_BEFORE_REDUCING
+                and self._off_streak % _IDLE_FULL_POLL_EVERY
+                else _POLL_CATEGORIES
             )
-        # Update Configuration : Fan
-        result = await self._winetclient.get_registers(
-            WinetRegisterKey.POLL_DATA, WinetRegisterCategory.POLL_CATEGORY_4
-        )
-        if result is not None:
-            self._data.update(
-                newdata=result, category=WinetRegisterCategory.POLL_CATEGORY_4
-            )
-        # Update Alarm
-        result = await self._winetclient.get_registers(
-            WinetRegisterKey.POLL_DATA, WinetRegisterCategory.POLL_CATEGORY_6
-        )
-        if result is not None:
-            self._data.update(
-                newdata=result, category=WinetRegisterCategory.POLL_CATEGORY_6
+
+            # Query the poll categories concurrently, then decode them in order
+            results = await asyncio.gather(
+                *(
+                    self._winetclient.get_registers(
+                        WinetRegisterKey.POLL_DATA, category
+                    )
+                    for category in categories
+                )
             )
-        # Take account  EcoMode
-        await self.set_temperature_without_delta(self._data.temperature_set)
+            for category, result in zip(categories, results, strict=True):
+                if result is not None:
+                    self._data.update(newdata=result, category=category)
+
+            if self._data.status is CircularDeviceStatus.OFF:
+                self._off_streak += 1
+            else:
+                self._off_streak = 0
+            # Take account  EcoMode, only when a delta is still pending
+            if self.delta_ecomode_ask:
+                await self.set_temperature_without_delta(self._data.temperature_set)
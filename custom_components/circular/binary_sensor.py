@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from operator import attrgetter
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -18,14 +19,14 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .coordinator import CircularDataUpdateCoordinator
 from .const import DOMAIN
 from .entity import CircularEntity
-from .api import CircularApiData
+from .api import CircularApiSnapshot
 
 
 @dataclass
 class CircularBinarySensorRequiredKeysMixin:
     """Mixin for required keys."""
 
-    value_fn: Callable[[CircularApiData], bool]
+    value_fn: Callable[[CircularApiSnapshot], bool]
 
 
 @dataclass
@@ -40,74 +41,74 @@ CIRCULAR_BINARY_SENSORS: tuple[CircularBinarySensorEntityDescription, ...] = (
         key="on_off",
         name="Power on",
         icon="mdi:power",
-        value_fn=lambda data: data.is_on,
+        value_fn=attrgetter("is_on"),
     ),
     CircularBinarySensorEntityDescription(
         key="heating",
         name="Heating",
         icon="mdi:fire",
-        value_fn=lambda data: data.is_heating,
+        value_fn=attrgetter("is_heating"),
     ),
     CircularBinarySensorEntityDescription(
         key="ecostop",
         name="Eco stop",
         icon="mdi:leaf",
-        value_fn=lambda data: data.is_ecomode_stop,
+        value_fn=attrgetter("is_ecomode_stop"),
     ),
     CircularBinarySensorEntityDescription(
         key="error_offline",
         name="Offline Error",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.error_offline,
+        value_fn=attrgetter("error_offline"),
         device_class=BinarySensorDeviceClass.PROBLEM,
     ),
     CircularBinarySensorEntityDescription(
         key="alarm_extractor_malfunction",
         name="Extractor malfunction Alarm",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.alarm_extractor_malfunction,
+        value_fn=attrgetter("alarm_extractor_malfunction"),
         device_class=BinarySensorDeviceClass.PROBLEM,
     ),
     CircularBinarySensorEntityDescription(
         key="alarm_failed_ignition",
         name="Failed ignition Alarm",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.alarm_failed_ignition,
+        value_fn=attrgetter("alarm_failed_ignition"),
         device_class=BinarySensorDeviceClass.PROBLEM,
     ),
     CircularBinarySensorEntityDescription(
         key="alarm_no_pellets",
         name="No pellets Alarm",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.alarm_no_pellets,
+        value_fn=attrgetter("alarm_no_pellets"),
         device_class=BinarySensorDeviceClass.PROBLEM,
     ),
     CircularBinarySensorEntityDescription(
         key="alarm_open_pellet_compartment",
         name="Open pellet compartment Alarm",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.alarm_open_pellet_compartment,
+        value_fn=attrgetter("alarm_open_pellet_compartment"),
         device_class=BinarySensorDeviceClass.PROBLEM,
     ),
     CircularBinarySensorEntityDescription(
         key="alarm_thermal_safety",
         name="Thermal safety Alarm",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.alarm_thermal_safety,
+        value_fn=attrgetter("alarm_thermal_safety"),
         device_class=BinarySensorDeviceClass.PROBLEM,
     ),
     CircularBinarySensorEntityDescription(
         key="alarm_smoke_overtemp",
         name="Smoke over temperature Alarm",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.alarm_smoke_overtemp,
+        value_fn=attrgetter("alarm_smoke_overtemp"),
         device_class=BinarySensorDeviceClass.PROBLEM,
     ),
     CircularBinarySensorEntityDescription(
         key="alarm_smoke_probe_failure",
         name="Smoke probe failure Alarm",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.alarm_smoke_probe_failure,
+        value_fn=attrgetter("alarm_smoke_probe_failure"),
         device_class=BinarySensorDeviceClass.PROBLEM,
     ),
 )
@@ -122,8 +123,10 @@ async def async_setup_entry(
     coordinator: CircularDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
     async_add_entities(
-        CircularBinarySensor(coordinator=coordinator, description=description)
-        for description in CIRCULAR_BINARY_SENSORS
+        [
+            CircularBinarySensor(coordinator=coordinator, description=description)
+            for description in CIRCULAR_BINARY_SENSORS
+        ]
     )
 
 
@@ -135,4 +138,4 @@ class CircularBinarySensor(CircularEntity, BinarySensorEntity):
     @property
     def is_on(self) -> bool:
         """Use this to get the correct value."""
-        return self.entity_description.value_fn(self.coordinator.read_api.data)
+        return self.entity_description.value_fn(self.coordinator.data)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from typing import Any, TYPE_CHECKING
 
 from homeassistant.components.climate import (
@@ -38,6 +39,14 @@ from .entity import CircularEntity
 if TYPE_CHECKING:
     from .coordinator import CircularDataUpdateCoordinator
 
+HVAC_OFF_STATUSES = frozenset(
+    {
+        CircularDeviceStatus.OFF,
+        CircularDeviceStatus.ALARM,
+        CircularDeviceStatus.UNKNOWN,
+    }
+)
+
 CIRCULAR_CLIMATES: tuple[ClimateEntityDescription, ...] = (
     ClimateEntityDescription(key="climate", name="Thermostat"),
 )
@@ -51,11 +60,13 @@ async def async_setup_entry(
     """Climate entity setup."""
     coordinator: CircularDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
     async_add_entities(
-        CircularClimate(
-            coordinator=coordinator,
-            description=description,
-        )
-        for description in CIRCULAR_CLIMATES
+        [
+            CircularClimate(
+                coordinator=coordinator,
+                description=description,
+            )
+            for description in CIRCULAR_CLIMATES
+        ]
     )
 
 
@@ -93,6 +104,7 @@ class CircularClimate(CircularEntity, ClimateEntity):
         FAN_HIGH: 5,
         FAN_AUTO: 6,
     }
+    register_fan_mode = {v: k for k, v in fan_mode_register.items()}
 
     def __init__(
         self,
@@ -106,18 +118,13 @@ class CircularClimate(CircularEntity, ClimateEntity):
     @property
     def hvac_mode(self) -> str:
         """Return current hvac mode."""
-        status = self.coordinator.read_api.data.status
-        if status not in [
-            CircularDeviceStatus.OFF,
-            CircularDeviceStatus.ALARM,
-            CircularDeviceStatus.UNKNOWN,
-        ]:
+        if self.coordinator.data.status not in HVAC_OFF_STATUSES:
             return HVACMode.HEAT
         return HVACMode.OFF
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set HVAC mode to normal or thermostat control."""
-        LOGGER.warning(
+        LOGGER.debug(
             "Setting hvac mode to [%s] - last temp: %s", hvac_mode, self.last_temp
         )
 
@@ -127,6 +134,7 @@ class CircularClimate(CircularEntity, ClimateEntity):
                 self.coordinator.read_api.data.temperature_read, self.last_temp
             )
             await self.coordinator.control_api.set_temperature(temp_c)
+            self.coordinator.async_update_from_api()
             return
 
         # ECO MODE : Restauration de la consigne de temperature, suite arrêt en ECO Mode
@@ -137,28 +145,31 @@ class CircularClimate(CircularEntity, ClimateEntity):
             await self.coordinator.control_api.set_temperature_with_delta(
                 self.coordinator.read_api.data.temperature_read
             )
+            self.coordinator.async_update_from_api()
         return
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Turn on thermostat by setting a target temperature."""
         raw_target_temp = kwargs[ATTR_TEMPERATURE]
         self.last_temp = raw_target_temp
-        LOGGER.warning(
-            "Setting target temp to %sc %sf",
-            int(raw_target_temp),
-            (raw_target_temp * 9 / 5) + 32,
-        )
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "Setting target temp to %sc %sf",
+                int(raw_target_temp),
+                (raw_target_temp * 9 / 5) + 32,
+            )
         await self.coordinator.control_api.set_temperature(raw_target_temp)
+        self.coordinator.async_update_from_api()
 
     @property
     def current_temperature(self) -> float:
         """Return the current temperature."""
-        return float(self.coordinator.read_api.data.temperature_read)
+        return float(self.coordinator.data.temperature_read)
 
     @property
     def target_temperature(self) -> float:
         """Return target temperature."""
-        return float(self.coordinator.read_api.data.temperature_set)
+        return float(self.coordinator.data.temperature_set)
 
     @property
     def turn_on(self):
@@ -180,15 +191,8 @@ class CircularClimate(CircularEntity, ClimateEntity):
 
     @property
     def fan_mode(self) -> str | None:
-        """Set new target fan mode."""
-        keys = [
-            k
-            for k, v in self.fan_mode_register.items()
-            if v == self.coordinator.read_api.data.fan_speed
-        ]
-        if keys:
-            return keys[0]
-        return FAN_AUTO
+        """Return the fan mode matching the stove fan speed."""
+        return self.register_fan_mode.get(self.coordinator.data.fan_speed, FAN_AUTO)
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set new target fan mode."""
@@ -196,3 +200,4 @@ class CircularClimate(CircularEntity, ClimateEntity):
         await self.coordinator.control_api.set_fan_speed(
             self.fan_mode_register[fan_mode]
         )
+        self.coordinator.async_update_from_api()
@@ -6,7 +6,9 @@ import voluptuous as vol
 from aiohttp import ClientConnectionError
 
 from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import DOMAIN, LOGGER, CONF_HOST
 from .api import CircularApiClient
@@ -16,10 +18,10 @@ STEP_USER_DATA_SCHEMA = vol.Schema({vol.Required(CONF_HOST): str})
 MANUAL_ENTRY_STRING = "IP Address"  # Simplified so it does not have to be translated
 
 
-async def validate_host_input(host: str) -> str:
+async def validate_host_input(hass: HomeAssistant, host: str) -> str:
     """Validate the user input allows us to connect."""
     LOGGER.debug("Instantiating Circular Winet-Control API with host: [%s]", host)
-    api = CircularApiClient(session=None, host=host)
+    api = CircularApiClient(session=async_get_clientsession(hass), host=host)
     await api.poll()
     productmodel = api.data.model.get_message()
     LOGGER.debug("Found a stove: %s", productmodel)
@@ -69,7 +71,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def _async_validate_ip_and_continue(self, host: str) -> FlowResult:
         """Validate local config and continue."""
         self._async_abort_entries_match({CONF_HOST: host})
-        self._productmodel = await validate_host_input(host)
+        self._productmodel = await validate_host_input(self.hass, host)
         await self.async_set_unique_id(self._productmodel, raise_on_progress=False)
         self._abort_if_unique_id_configured(updates={CONF_HOST: host})
         # Store current data and jump to next stage
@@ -22,13 +22,13 @@ ICON = "mdi:fire"
 BINARY_SENSOR_DEVICE_CLASS = "connectivity"
 
 # Platforms
-PLATFORMS = [
+PLATFORMS: tuple[Platform, ...] = (
     Platform.BINARY_SENSOR,
     Platform.CLIMATE,
     Platform.NUMBER,
     Platform.SENSOR,
     Platform.SWITCH,
-]
+)
 
 # Configuration and options
 CONF_ENABLED = "enabled"
@@ -49,6 +49,9 @@ MAX_THERMOSTAT_TEMP = 40
 MIN_POWER = 1
 MAX_POWER = 5
 
+MAX_POLL_BACKOFF = 60  # seconds between polls while the stove is unreachable
+OPTIMISTIC_STATE_TIMEOUT = 60  # seconds a commanded state is shown unconfirmed
+
 MIN_FAN_SPEED = 0
 MAX_FAN_SPEED = 6  # 6 = (AUTO)
 
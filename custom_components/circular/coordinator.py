@@ -2,20 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 
 from aiohttp import ClientConnectionError
-from async_timeout import timeout
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import DOMAIN, LOGGER
-from .api import CircularApiData, CircularApiClient
+from .api import CircularApiClient, CircularApiSnapshot
 
 
-class CircularDataUpdateCoordinator(DataUpdateCoordinator[CircularApiData]):
+class CircularDataUpdateCoordinator(DataUpdateCoordinator[CircularApiSnapshot]):
     """Class to manage the polling of the fireplace API."""
 
     def __init__(
@@ -28,47 +28,58 @@ class CircularDataUpdateCoordinator(DataUpdateCoordinator[CircularApiData]):
             hass,
             LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=2),
+            update_interval=timedelta(seconds=15),
+            always_update=False,
         )
         self._api = api
+        self.read_api = api
+        self.control_api = api
+        self._device_info: DeviceInfo | None = None
+        # The background loop pushes fresh data, the coordinator refresh only
+        # supervises the loop and surfaces repeated polling failures
+        api.set_poll_listener(self.async_update_from_api)
 
-    async def _async_update_data(self) -> CircularApiData:
+    @callback
+    def async_update_from_api(self) -> None:
+        """Push the latest snapshot to entities when it changed."""
+        snapshot = self._api.data.snapshot
+        if snapshot != self.data:
+            self.async_set_updated_data(snapshot)
+
+    async def _async_update_data(self) -> CircularApiSnapshot:
         if not self._api.is_polling_in_background:
+            if self.data is None:
+                # Don't return uninitialized poll data
+                async with asyncio.timeout(15):
+                    try:
+                        await self._api.poll()
+                    except (ConnectionError, ClientConnectionError) as exception:
+                        raise UpdateFailed from exception
+
+            # the loop waits one interval before its first poll, so the
+            # initial refresh does not query the stove twice
             LOGGER.info("Starting Circular Background Polling Loop")
             await self._api.start_background_polling()
 
-            # Don't return uninitialized poll data
-            async with timeout(15):
-                try:
-                    await self._api.poll()
-                except (ConnectionError, ClientConnectionError) as exception:
-                    raise UpdateFailed from exception
-
-        LOGGER.debug("Failure Count %d", self._api.failed_poll_attempts)
-        if self._api.failed_poll_attempts > 10:
-            LOGGER.debug("Too many polling errors - raising exception")
-            raise UpdateFailed
-
-        return self._api.data
+        if failed := self._api.failed_poll_attempts:
+            LOGGER.debug("Failure Count %d", failed)
+            if failed > 10:
+                LOGGER.debug("Too many polling errors - raising exception")
+                raise UpdateFailed
 
-    @property
-    def read_api(self) -> CircularApiClient:
-        """Return the Status API pointer."""
-        return self._api
-
-    @property
-    def control_api(self) -> CircularApiClient:
-        """Return the control API."""
-        return self._api
+        # Entities are only notified when the snapshot differs from the last one
+        return self._api.data.snapshot
 
     @property
     def device_info(self) -> DeviceInfo:
-        """Return the device info."""
-        return DeviceInfo(
-            manufacturer="Ravelli",
-            model="Circular 8",
-            name=self.read_api.data.name,
-            identifiers={("Circular", f"{self.read_api.data.model}]")},
-            sw_version="1.0",
-            configuration_url=f"http://{self._api.stove_ip}/",
-        )
+        """Return the device info, built once the stove has been polled."""
+        if self._device_info is None:
+            self._device_info = DeviceInfo(
+                manufacturer="Ravelli",
+                model="Circular 8",
+                name=self.read_api.data.name,
+                identifiers={("Circular", f"{self.read_api.data.model}]")},
+                sw_version="1.0",
+                configuration_url=f"http://{self._api.stove_ip}/",
+            )
+        return self._device_info
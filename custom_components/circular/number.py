@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-
 from homeassistant.components.number import (
     NumberEntity,
     NumberEntityDescription,
@@ -40,14 +38,6 @@ async def async_setup_entry(
         icon="mdi:arrow-expand-vertical",
     )
 
-    async_add_entities(
-        [
-            CircularPowerControlEntity(
-                coordinator=coordinator, description=descriptionpower
-            )
-        ]
-    )
-
     descriptiondelta = NumberEntityDescription(
         key="delta eco mode",
         name="Delta ECO mode Control",
@@ -55,11 +45,17 @@ async def async_setup_entry(
     )
 
     async_add_entities(
-        [EcoDeltaControlEntity(coordinator=coordinator, description=descriptiondelta)]
+        [
+            CircularPowerControlEntity(
+                coordinator=coordinator, description=descriptionpower
+            ),
+            EcoDeltaControlEntity(
+                coordinator=coordinator, description=descriptiondelta
+            ),
+        ]
     )
 
 
-@dataclass
 class CircularPowerControlEntity(CircularEntity, NumberEntity):
     """Power control entity."""
 
@@ -79,7 +75,7 @@ class CircularPowerControlEntity(CircularEntity, NumberEntity):
     @property
     def native_value(self) -> float | None:
         """Return the current power number value."""
-        value = self.coordinator.read_api.data.power_set
+        value = self.coordinator.data.power_set
         return value
 
     async def async_set_native_value(self, value: float) -> None:
@@ -92,10 +88,10 @@ class CircularPowerControlEntity(CircularEntity, NumberEntity):
             value_to_send,
         )
         await self.coordinator.control_api.set_power(value=value_to_send)
-        await self.coordinator.async_refresh()
+        # the client stores an accepted value, show it without waiting a poll
+        self.coordinator.async_update_from_api()
 
 
-@dataclass
 class EcoDeltaControlEntity(CircularEntity, NumberEntity):
     """Delta Power control entity."""
 
@@ -129,5 +125,4 @@ class EcoDeltaControlEntity(CircularEntity, NumberEntity):
         )
         self._attr_native_value = value_to_send
         await self.coordinator.control_api.set_delta_temp(value=value_to_send)
-        await self.coordinator.async_refresh()
         self.async_write_ha_state()
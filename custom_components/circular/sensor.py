@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -21,14 +22,14 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .const import DOMAIN
 from .coordinator import CircularDataUpdateCoordinator
 from .entity import CircularEntity
-from .api import CircularApiData
+from .api import CircularApiSnapshot
 
 
 @dataclass
 class CircularSensorRequiredKeysMixin:
     """Mixin for required keys."""
 
-    value_fn: Callable[[CircularApiData], float | int | str | datetime | None]
+    value_fn: Callable[[CircularApiSnapshot], float | int | str | datetime | None]
 
 
 @dataclass
@@ -45,7 +46,7 @@ Circular_SENSORS: tuple[CircularSensorEntityDescription, ...] = (
         icon="mdi:fire-circle",
         name="Power",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.power_set,
+        value_fn=attrgetter("power_set"),
     ),
     CircularSensorEntityDescription(
         key="temperature_set",
@@ -53,7 +54,7 @@ Circular_SENSORS: tuple[CircularSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda data: data.temperature_set,
+        value_fn=attrgetter("temperature_set"),
     ),
     CircularSensorEntityDescription(
         key="temperature_read",
@@ -61,7 +62,7 @@ Circular_SENSORS: tuple[CircularSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda data: data.temperature_read,
+        value_fn=attrgetter("temperature_read"),
     ),
     CircularSensorEntityDescription(
         key="status",
@@ -71,28 +72,28 @@ Circular_SENSORS: tuple[CircularSensorEntityDescription, ...] = (
     CircularSensorEntityDescription(
         key="alarms",
         name="Alarms",
-        value_fn=lambda data: data.alr,
+        value_fn=attrgetter("alr"),
         # entity_registry_enabled_default=False,
     ),
     CircularSensorEntityDescription(
         key="name",
         name="Name",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.name,
+        value_fn=attrgetter("name"),
         entity_registry_enabled_default=False,
     ),
     CircularSensorEntityDescription(
         key="host",
         name="Host",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.host,
+        value_fn=attrgetter("host"),
         entity_registry_enabled_default=False,
     ),
     CircularSensorEntityDescription(
         key="wifi_signal",
         name="Wifi Signal Strength",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.signal,
+        value_fn=attrgetter("signal"),
         # entity_registry_enabled_default=False,
     ),
     CircularSensorEntityDescription(
@@ -112,8 +113,10 @@ async def async_setup_entry(
 
     coordinator: CircularDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
     async_add_entities(
-        CircularSensor(coordinator=coordinator, description=description)
-        for description in Circular_SENSORS
+        [
+            CircularSensor(coordinator=coordinator, description=description)
+            for description in Circular_SENSORS
+        ]
     )
 
 
@@ -125,4 +128,4 @@ class CircularSensor(CircularEntity, SensorEntity):
     @property
     def native_value(self) -> float | int | str | datetime | None:
         """Return the state."""
-        return self.entity_description.value_fn(self.coordinator.read_api.data)
+        return self.entity_description.value_fn(self.coordinator.data)
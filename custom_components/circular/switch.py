@@ -4,17 +4,20 @@ from __future__ import annotations
 
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
+from datetime import datetime
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 
-from .const import DOMAIN
+from .const import DOMAIN, OPTIMISTIC_STATE_TIMEOUT
 from .coordinator import CircularDataUpdateCoordinator
 from .entity import CircularEntity
-from .api import CircularApiClient, CircularApiData
+from .api import CircularApiClient, CircularApiSnapshot
 
 
 @dataclass()
@@ -23,7 +26,7 @@ class CircularSwitchRequiredKeysMixin:
 
     on_fn: Callable[[CircularApiClient], Awaitable]
     off_fn: Callable[[CircularApiClient], Awaitable]
-    value_fn: Callable[[CircularApiData], bool]
+    value_fn: Callable[[CircularApiSnapshot], bool]
 
 
 @dataclass
@@ -39,7 +42,7 @@ CIRCULAR_SWITCHES: tuple[CircularSwitchEntityDescription, ...] = (
         name="Turn On",
         on_fn=lambda control_api: control_api.turn_on(),
         off_fn=lambda control_api: control_api.turn_off(),
-        value_fn=lambda data: data.is_on,
+        value_fn=attrgetter("is_on"),
     ),
 )
 
@@ -53,8 +56,10 @@ async def async_setup_entry(
     coordinator: CircularDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
     async_add_entities(
-        CircularSwitch(coordinator=coordinator, description=description)
-        for description in CIRCULAR_SWITCHES
+        [
+            CircularSwitch(coordinator=coordinator, description=description)
+            for description in CIRCULAR_SWITCHES
+        ]
     )
 
 
@@ -63,17 +68,64 @@ class CircularSwitch(CircularEntity, SwitchEntity):
 
     entity_description: CircularSwitchEntityDescription
 
+    # state assumed after a command, until the stove reports it
+    _optimistic_is_on: bool | None = None
+    _optimistic_unsub: CALLBACK_TYPE | None = None
+
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the switch."""
         await self.entity_description.on_fn(self.coordinator.control_api)
-        await self.async_update_ha_state(force_refresh=True)
+        self._assume_state(is_on=True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the switch."""
         await self.entity_description.off_fn(self.coordinator.control_api)
-        await self.async_update_ha_state(force_refresh=True)
+        self._assume_state(is_on=False)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending assumed state expiry."""
+        self._clear_assumed_state()
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _assume_state(self, *, is_on: bool) -> None:
+        """Show the requested state until the stove reports it or it expires."""
+        self._clear_assumed_state()
+        self._optimistic_is_on = is_on
+        self._optimistic_unsub = async_call_later(
+            self.hass, OPTIMISTIC_STATE_TIMEOUT, self._expire_assumed_state
+        )
+        self.async_write_ha_state()
+
+    @callback
+    def _clear_assumed_state(self) -> None:
+        """Drop the assumed state and its expiry timer."""
+        self._optimistic_is_on = None
+        if self._optimistic_unsub is not None:
+            self._optimistic_unsub()
+            self._optimistic_unsub = None
+
+    @callback
+    def _expire_assumed_state(self, _now: datetime) -> None:
+        """Fall back to the reported state, the stove never confirmed it."""
+        self._optimistic_unsub = None
+        self._optimistic_is_on = None
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Drop the assumed state once the stove reports it."""
+        if (
+            self._optimistic_is_on is not None
+            and self.entity_description.value_fn(self.coordinator.data)
+            == self._optimistic_is_on
+        ):
+            self._clear_assumed_state()
+        super()._handle_coordinator_update()
 
     @property
     def is_on(self) -> bool | None:
         """Return the on state."""
-        return self.entity_description.value_fn(self.coordinator.read_api.data)
+        if self._optimistic_is_on is not None:
+            return self._optimistic_is_on
+        return self.entity_description.value_fn(self.coordinator.data)
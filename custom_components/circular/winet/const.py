@@ -16,21 +16,17 @@ class WinetProductModel(Enum):  # type: ignore
 
     def get_message(self) -> str:
         """Get a message associated with the enum."""
-        if self.name == "UNSET":
-            return "Unset"
-        if self.name == "L023_1":
-            return "L023 - 1"
-        if self.name == "N100_O047":
-            return "N100 / O047"
-        if self.name == "O086":
-            return "O086"
-        if self.name == "L023_2":
-            return "L023 - 2"
-        if self.name == "U047":
-            return "U047"
-        if self.name == "80023CR01":
-            return "80023CR01"
-        return "UNKNOWN"
+        return _PRODUCT_MODEL_MESSAGES.get(self, "UNKNOWN")
+
+
+_PRODUCT_MODEL_MESSAGES: dict[WinetProductModel, str] = {
+    WinetProductModel.UNSET: "Unset",
+    WinetProductModel.L023_1: "L023 - 1",
+    WinetProductModel.N100_O047: "N100 / O047",
+    WinetProductModel.O086: "O086",
+    WinetProductModel.L023_2: "L023 - 2",
+    WinetProductModel.U047: "U047",
+}
 
 
 class WinetRegister(Enum):
@@ -1,17 +1,36 @@
 """Model definitions."""
 
-from pydantic import BaseModel, Field
+from __future__ import annotations
 
+from dataclasses import dataclass, field
+from typing import Any
 
-class WinetGetRegisterResult(BaseModel):
+
+@dataclass(slots=True)
+class WinetGetRegisterResult:
     """Base model for Winet stove status data."""
 
-    fwUpdate: bool = Field(default=False)
-    localWeb: int = Field(default=0)
-    model: int = Field(default=0)
-    cat: int = Field(default=0)
-    signal: int = Field(default=0)
-    authlevel: int = Field(default=0)
-    name: str = Field(default="NO NAME")
-    alr: str = Field(default="")
-    params: list[list[int]] = Field(default=[])
+    fwUpdate: bool = False
+    localWeb: int = 0
+    model: int = 0
+    cat: int = 0
+    signal: int = 0
+    authlevel: int = 0
+    name: str = "NO NAME"
+    alr: str = ""
+    params: list[list[int]] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> WinetGetRegisterResult:
+        """Build a result from a decoded get-registers response."""
+        return cls(
+            fwUpdate=bool(data.get("fwUpdate", False)),
+            localWeb=int(data.get("localWeb", 0)),
+            model=int(data.get("model", 0)),
+            cat=int(data.get("cat", 0)),
+            signal=int(data.get("signal", 0)),
+            authlevel=int(data.get("authlevel", 0)),
+            name=str(data.get("name", "NO NAME")),
+            alr=str(data.get("alr", "")),
+            params=data.get("params", []),
+        )
@@ -1,16 +1,16 @@
 """Winet-Control API"""
 
 from __future__ import annotations
+import asyncio
 import logging
 
+from http import HTTPStatus
 from json import JSONDecodeError
+from urllib.parse import urlencode
 
 import aiohttp
-from aiohttp import (
-    ClientConnectorError,
-    ClientOSError,
-    ServerDisconnectedError,
-)
+import orjson
+from yarl import URL
 
 from .model import WinetGetRegisterResult
 from .const import (
@@ -21,6 +21,26 @@ from .const import (
 
 LOGGER = logging.getLogger(__package__)
 
+# built once and shared by every request; the module sits on the LAN, so
+# fail fast on a hung connection instead of holding a request slot
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=8, connect=2, sock_read=5)
+
+# the module's web server copes with the concurrent category polls, but
+# any request beyond those waits for a free slot instead of a new socket
+MAX_CONCURRENT_REQUESTS = 3
+
+# failures of the request itself, reported to callers as ConnectionError
+_TRANSPORT_ERRORS = (
+    aiohttp.ClientError,
+    ConnectionError,
+    asyncio.IncompleteReadError,
+    TimeoutError,
+)
+
+# form values for the enum members, formatted once at import
+_REGISTER_IDS = {register: str(register.value) for register in WinetRegister}
+_CATEGORY_IDS = {category: str(category.value) for category in WinetRegisterCategory}
+
 
 class WinetAPILocal:
     """Bottom level API. handle http communication with the local winet module"""
@@ -29,6 +49,43 @@ class WinetAPILocal:
         """Initialize Winet local api."""
         self._session = session
         self._stove_ip = stove_ip
+        # parsed once, aiohttp would otherwise parse a str url on every request
+        self._get_registers_url = URL(f"http://{stove_ip}/ajax/get-registers")
+        self._set_register_url = URL(f"http://{stove_ip}/ajax/set-register")
+        self._request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._request_bodies: dict[
+            tuple[WinetRegisterKey, WinetRegisterCategory], bytes
+        ] = {}
+        # last raw body and parsed result per request, to skip re-parsing
+        self._last_results: dict[
+            tuple[WinetRegisterKey, WinetRegisterCategory],
+            tuple[bytes, WinetGetRegisterResult],
+        ] = {}
+        # the headers only depend on the stove address, share them across calls
+        self._get_registers_headers = {
+            "Access-Control-Request-Method": "POST",
+            "Host": f"{stove_ip}",
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36 Edg/131.0.0.0",
+            "Accept": "application/json, text/javascript, */*; q=0.01",
+            "Accept-Encoding": "gzip, deflate",
+            "Content-Type": "application/json; charset=utf-8",
+            "X-Requested-With": "XMLHttpRequest",
+            "Origin": f"http://{stove_ip}",
+            "Referer": f"http://{stove_ip}/management.html",
+            "Accept-Language": "fr,fr-FR;q=0.9,en;q=0.8,en-GB;q=0.7,en-US;q=0.6",
+            "Connection": "keep - alive",
+        }
+        self._set_register_headers = {
+            "Access-Control-Request-Method": "POST",
+            "Host": f"{stove_ip}",
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36 Edg/130.0.0.0",
+            "Accept": "application/json, text/javascript, */*; q=0.01",
+            "Accept-Encoding": "gzip, deflate",
+            "Content-Type": "application/json; charset=utf-8",
+            "X-Requested-With": "XMLHttpRequest",
+            "Origin": f"http://{stove_ip}",
+            "Referer": f"http://{stove_ip}/management.html",
+        }
 
     async def get_registers(
         self,
@@ -36,125 +93,121 @@ class WinetAPILocal:
         category: WinetRegisterCategory = WinetRegisterCategory.NONE,
     ):
         """Poll registers"""
-        async with aiohttp.ClientSession() as session:
-            url = f"http://{self._stove_ip}/ajax/get-registers"
-            data = {"key": key.value}
-
+        url = self._get_registers_url
+        # the form body only depends on the key and category, encode it once
+        data = self._request_bodies.get((key, category))
+        if data is None:
+            form = {"key": key.value}
             if category != WinetRegisterCategory.NONE:
-                data["category"] = str(category.value)
-
-            headers = {
-                "Access-Control-Request-Method": "POST",
-                "Host": f"{self._stove_ip}",
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36 Edg/131.0.0.0",
-                "Accept": "application/json, text/javascript, */*; q=0.01",
-                "Accept-Encoding": "gzip, deflate",
-                "Content-Type": "application/json; charset=utf-8",
-                "X-Requested-With": "XMLHttpRequest",
-                "Origin": f"http://{self._stove_ip}",
-                "Referer": f"http://{self._stove_ip}/management.html",
-                "Accept-Language": "fr,fr-FR;q=0.9,en;q=0.8,en-GB;q=0.7,en-US;q=0.6",
-                "Connection": "keep - alive",
-            }
-            LOGGER.debug(f"Querying {url} with data={data}")
-            try:
-                async with session.post(url, data=data, headers=headers) as response:
-                    try:
-                        if response.status != 200:
-                            LOGGER.warning(f"Error accessing {url} - {response.status}")
-                            raise ConnectionError(
-                                f"Communication error - Response status {response.status}"
-                            )
-                        try:
-                            json_data = await response.json(content_type=None)
-                            LOGGER.debug("Received: %s", json_data)
-
-                            if "result" in json_data:
-                                # handle an action's result
-                                if json_data["result"] is False:
-                                    LOGGER.warning("Api result is False")
-                            else:
-                                try:
-                                    return WinetGetRegisterResult(**json_data)
-                                except Exception:
-                                    LOGGER.warning("Error parsing poll data")
-                                    LOGGER.debug(f"Received: {json_data}")
-                            # TODO: what about model check exceptions ?
-                        except JSONDecodeError:
-                            LOGGER.warning("Error decoding JSON: [%s]", response.text)
-
-                    except ConnectionError as exc:
-                        LOGGER.warning(f"Connection Error accessing {url}")
-                        raise ConnectionError(
-                            "ConnectionError - host not found"
-                        ) from exc
-            except (
-                ServerDisconnectedError,
-                ClientConnectorError,
-                ClientOSError,
-                ConnectionError,
-                UnboundLocalError,
+                form["category"] = _CATEGORY_IDS[category]
+            data = self._request_bodies[key, category] = urlencode(form).encode()
+
+        LOGGER.debug("Querying %s with data=%s", url, data)
+        try:
+            async with (
+                self._request_slots,
+                self._session.post(
+                    url,
+                    data=data,
+                    headers=self._get_registers_headers,
+                    timeout=REQUEST_TIMEOUT,
+                ) as response,
             ):
-                raise ConnectionError()
-            except Exception as unknown_error:
-                LOGGER.error("Unhandled Exception %s", type(unknown_error))
+                status = response.status
+                body = await response.read() if status == HTTPStatus.OK else b""
+        except _TRANSPORT_ERRORS as exc:
+            LOGGER.warning("Connection Error accessing %s", url)
+            raise ConnectionError("ConnectionError - host not found") from exc
+
+        if status != HTTPStatus.OK:
+            LOGGER.warning("Error accessing %s - %s", url, status)
+            raise ConnectionError(f"Communication error - Response status {status}")
+
+        # the stove mostly answers with the same payload, reuse the
+        # previous result instead of decoding and validating it again
+        cached = self._last_results.get((key, category))
+        if cached is not None and cached[0] == body:
+            return cached[1]
+
+        try:
+            json_data = orjson.loads(body)
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        except JSONDecodeError:
+            LOGGER.warning("Error decoding JSON: [%s]", body)
+            return None
+        if not isinstance(json_data, dict):
+            LOGGER.warning("Unexpected JSON response: [%s]", body)
+            return None
+        LOGGER.debug("Received: %s", json_data)
+
+        if "result" in json_data:
+            # handle an action's result
+            if json_data["result"] is False:
+                LOGGER.warning("Api result is False")
+            return None
+
+        try:
+            result = WinetGetRegisterResult.from_dict(json_data)
+        except (AttributeError, TypeError, ValueError):
+            LOGGER.warning("Error parsing poll data")
+            LOGGER.debug("Received: %s", json_data)
+            return None
+        self._last_results[key, category] = (body, result)
+        return result
+
+    def forget_result(
+        self, key: WinetRegisterKey, category: WinetRegisterCategory
+    ) -> None:
+        """Drop the cached result so the next identical body is parsed again."""
+        self._last_results.pop((key, category), None)
 
     async def set_register(
         self, registerid: WinetRegister, value: int, key="002", memory=1
-    ):
-        """send raw register values !!!"""
+    ) -> bool:
+        """send raw register values !!! Return whether the module accepted it."""
         # data exemple: key=002&memory=1&regId=51&value=3
-        async with aiohttp.ClientSession() as session:
-            url = f"http://{self._stove_ip}/ajax/set-register"
-            data = {
+        url = self._set_register_url
+        data = urlencode(
+            {
                 "key": key,
                 "memory": str(memory),
-                "regId": str(registerid.value),
+                "regId": _REGISTER_IDS[registerid],
                 "value": str(value),
             }
-            headers = {
-                "Access-Control-Request-Method": "POST",
-                "Host": f"{self._stove_ip}",
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36 Edg/130.0.0.0",
-                "Accept": "application/json, text/javascript, */*; q=0.01",
-                "Accept-Encoding": "gzip, deflate",
-                "Content-Type": "application/json; charset=utf-8",
-                "X-Requested-With": "XMLHttpRequest",
-                "Origin": f"http://{self._stove_ip}",
-                "Referer": f"http://{self._stove_ip}/management.html",
-            }
-            LOGGER.debug(f"Posting to {url}, data={data}")
-            try:
-                async with session.post(url, data=data, headers=headers) as response:
-                    try:
-                        # TODO: log others error responses codes
-                        if response.status != 200:
-                            # Valid address - but poll endpoint not found
-                            LOGGER.warning(f"Error accessing {url} - {response.status}")
-                            raise ConnectionError(
-                                f"Error accessing {url} - {response.status}"
-                            )
-                        try:
-                            # returns {'result': False} if failed (or True if success)
-                            json_data = await response.json(content_type=None)
-                            if json_data["result"] is not True:
-                                LOGGER.debug("Received: %s", json_data)
-
-                        except JSONDecodeError:
-                            LOGGER.warning("Error decoding JSON: [%s]", response.text)
-                    except ConnectionError as exc:
-                        LOGGER.warning(f"Connection Error accessing {url}")
-                        raise ConnectionError(
-                            "ConnectionError - host not found"
-                        ) from exc
-
-            except (
-                ServerDisconnectedError,
-                ClientConnectorError,
-                ClientOSError,
-                ConnectionError,
-                UnboundLocalError,
-            ) as exc:
-                raise ConnectionError() from exc
-            except Exception as unknown_error:
-                LOGGER.error("Unhandled Exception %s", type(unknown_error))
+        ).encode()
+        LOGGER.debug("Posting to %s, data=%s", url, data)
+        try:
+            async with (
+                self._request_slots,
+                self._session.post(
+                    url,
+                    data=data,
+                    headers=self._set_register_headers,
+                    timeout=REQUEST_TIMEOUT,
+                ) as response,
+            ):
+                status = response.status
+                body = await response.read() if status == HTTPStatus.OK else b""
+        except _TRANSPORT_ERRORS as exc:
+            LOGGER.warning("Connection Error accessing %s", url)
+            raise ConnectionError("ConnectionError - host not found") from exc
+
+        # TODO: log others error responses codes
+        if status != HTTPStatus.OK:
+            # Valid address - but poll endpoint not found
+            LOGGER.warning("Error accessing %s - %s", url, status)
+            raise ConnectionError(f"Error accessing {url} - {status}")
+
+        try:
+            # returns {'result': False} if failed (or True if success)
+            json_data = orjson.loads(body)
+        except JSONDecodeError:
+            LOGGER.warning("Error decoding JSON: [%s]", body)
+            return False
+        if not isinstance(json_data, dict):
+            LOGGER.warning("Unexpected JSON response: [%s]", body)
+            return False
+        if json_data.get("result") is not True:
+            LOGGER.debug("Received: %s", json_data)
+            return False
+        return True